@@ -10,9 +10,9 @@ Author(s): Alec Delaney (Tekktrik)
 import os
 import pathlib
 import shutil
+from typing import Any, Dict, Optional, Tuple
 
 import typer
-import yaml
 
 __version__ = "0.0.0+auto.0"
 
@@ -20,21 +20,63 @@ __version__ = "0.0.0+auto.0"
 APP_DIRECTORY = typer.get_app_dir("circlink")
 LINKS_DIRECTORY = os.path.join(APP_DIRECTORY, "links")
 LEDGER_FILE = os.path.join(APP_DIRECTORY, "ledger.csv")
-SETTINGS_FILE = os.path.join(APP_DIRECTORY, "settings.yaml")
+SETTINGS_FILE = os.path.join(APP_DIRECTORY, "settings.json")
+LEGACY_SETTINGS_FILE = os.path.join(APP_DIRECTORY, "settings.yaml")
 WORKSPACE_DIRECTORY = os.path.join(APP_DIRECTORY, "workspaces")
 WORKSPACE_LIST_DIRECTORY = os.path.join(WORKSPACE_DIRECTORY, "saved")
 CURRENT_WORKSPACE_FILE = os.path.join(WORKSPACE_DIRECTORY, "current.txt")
 
 
+# Cache of the parsed settings file, along with its modification time
+_settings_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
+
 def get_settings():
-    """Get the contents of the settings file."""
-    with open(SETTINGS_FILE, encoding="utf-8") as yamlfile:
-        return yaml.safe_load(yamlfile)
+    """Get the contents of the settings file.
+
+    The parsed contents are cached until the settings file is modified.
+    """
+    import copy
+    import json
+
+    global _settings_cache  # noqa: PLW0603
+
+    # Return a copy of the cached settings so callers can modify them safely
+    mtime = os.stat(SETTINGS_FILE).st_mtime_ns
+    if _settings_cache and _settings_cache[0] == mtime:
+        return copy.deepcopy(_settings_cache[1])
+
+    with open(SETTINGS_FILE, encoding="utf-8") as jsonfile:
+        settings = json.load(jsonfile)
+    _settings_cache = (mtime, copy.deepcopy(settings))
+    return settings
+
+
+def save_settings(settings: Dict[str, Any]) -> None:
+    """Save the contents of the settings file.
+
+    The settings are written to a temporary file which then replaces the
+    settings file, so the settings file is never left partially written.
+    """
+    import json
+    import tempfile
+
+    # Use a unique temporary file, removing it if the settings cannot be saved
+    temp_fd, temp_settings_file = tempfile.mkstemp(suffix=".tmp", dir=APP_DIRECTORY)
+    try:
+        with open(temp_fd, mode="wb") as jsonfile:
+            jsonfile.write(json.dumps(settings, indent=2).encode("utf-8"))
+        if os.path.exists(SETTINGS_FILE):
+            shutil.copymode(SETTINGS_FILE, temp_settings_file)
+        os.replace(temp_settings_file, SETTINGS_FILE)
+    except BaseException:
+        os.remove(temp_settings_file)
+        raise
 
 
 def reset_config_file() -> None:
     """Reset the config file."""
-    settings_file = os.path.join(__file__, "..", "templates", "settings.yaml")
+    settings_file = os.path.join(__file__, "..", "templates", "settings.json")
     shutil.copy(os.path.abspath(settings_file), SETTINGS_FILE)
 
 
@@ -54,6 +96,36 @@ def ensure_settings_file() -> None:
     settings_path = pathlib.Path(SETTINGS_FILE)
     if not settings_path.exists():
         reset_config_file()
+        if os.path.exists(LEGACY_SETTINGS_FILE):
+            migrate_legacy_settings_file()
+
+
+def migrate_legacy_settings_file() -> None:
+    """Migrate the settings from the legacy YAML settings file, if possible."""
+    try:
+        import yaml
+    except ImportError:
+        print(
+            f"Settings in {LEGACY_SETTINGS_FILE} could not be migrated without "
+            "PyYAML installed, default settings will be used instead"
+        )
+        return
+
+    # Read the legacy settings, keeping the defaults if they cannot be used
+    try:
+        with open(LEGACY_SETTINGS_FILE, encoding="utf-8") as yamlfile:
+            legacy_settings = yaml.safe_load(yamlfile)
+    except yaml.YAMLError:
+        legacy_settings = None
+    if not isinstance(legacy_settings, dict):
+        print(
+            f"Settings in {LEGACY_SETTINGS_FILE} could not be read, "
+            "default settings will be used instead"
+        )
+        return
+
+    save_settings(legacy_settings)
+    os.remove(LEGACY_SETTINGS_FILE)
 
 
 def ensure_links_folder() -> None:
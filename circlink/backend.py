@@ -12,17 +12,16 @@ import os
 import signal
 from typing import Iterable, List
 
-import circup
 import psutil
-import tabulate
 from typer import Exit
 
 import circlink
 import circlink.ledger
 import circlink.link
+import circlink.table
 
 
-def start_backend(  # noqa: PLR0913, PLR0912
+def start_backend(  # noqa: PLR0913, PLR0912, PLR0915
     read_path: str,
     write_path: str,
     base_dir: str,
@@ -41,6 +40,8 @@ def start_backend(  # noqa: PLR0913, PLR0912
 
     # Attempt to find the CircuitPython board unless explicitly set otherwise
     if not path:
+        import circup
+
         device_path = circup.find_device()
         if not device_path:
             print("Cound not auto-detect board path!")
@@ -219,23 +220,14 @@ def retrieve_links_info(
     exclude: Iterable[str] = ("Base Directory",),
 ) -> List[tuple]:
     """Retrieve information about a collection of links."""
-    # Discard the link base directory for printing purposes
-    show_list = list(circlink.link.get_links_header())
-    link_infos = list(
-        circlink.link.get_links_list(pattern, abs_paths=abs_paths, folder=folder)
+    # Only retrieve the columns that are not excluded
+    fields = [
+        header for header in circlink.link.get_links_header() if header not in exclude
+    ]
+    return circlink.link.get_links_list(
+        pattern, abs_paths=abs_paths, folder=folder, fields=fields
     )
 
-    # Remove unwanted columns
-    new_link_infos = []
-    for entry in link_infos:
-        new_entry = ()
-        for exculde_index, exclude_col in enumerate(show_list):
-            if exclude_col not in exclude:
-                new_entry: tuple = new_entry + (entry[exculde_index],)
-        new_link_infos.append(new_entry)
-
-    return new_link_infos
-
 
 def view_backend(
     pattern: str = "*",
@@ -245,18 +237,13 @@ def view_backend(
     exclude: Iterable[str] = ("Base Directory",),
 ) -> None:
     """View a collection of links (backend)."""
-    show_list = list(circlink.link.get_links_header())
-    for exclude_header in exclude:
-        show_list.remove(exclude_header)
-    show_list = tuple(show_list)
-    if (
-        not circlink.get_settings()["display"]["info"]["process-id"]
-        and "Process ID" not in exclude
-    ):
-        exclude = exclude + ("Process ID",)
-        show_list = list(show_list)
-        show_list.remove("Process ID")
-        show_list = tuple(show_list)
+    # Discard the process ID column depending on settings
+    settings = circlink.get_settings()
+    if not settings["display"]["info"]["process-id"] and "Process ID" not in exclude:
+        exclude = tuple(exclude) + ("Process ID",)
+    show_list = tuple(
+        header for header in circlink.link.get_links_header() if header not in exclude
+    )
 
     # Discard the link base directory for printing purposes
     link_infos = retrieve_links_info(
@@ -266,10 +253,10 @@ def view_backend(
     # Print the table with the format based on config settings
     if link_infos:
         print(
-            tabulate.tabulate(
+            circlink.table.render_table(
                 link_infos,
-                headers=show_list,
-                tablefmt=circlink.get_settings()["display"]["table"]["format"],
+                show_list,
+                settings["display"]["table"]["format"],
             )
         )
 
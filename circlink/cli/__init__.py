@@ -7,242 +7,84 @@
 Author(s): Alec Delaney (Tekktrik)
 """
 
+import importlib
 import os
 import shutil
-import sys
+from typing import List, Optional, Tuple
 
-import circup
-import tabulate
-from typer import Argument, Exit, Option, Typer
+import typer.main
+from typer import Context, Exit, Option, Typer
+from typer.core import TyperGroup
 
 import circlink
-import circlink.backend
-import circlink.ledger
-import circlink.link
-from circlink.cli import config, workspace
 
-# Prevent running on non-POSIX systems that don't have os.fork()
-if os.name != "posix":
-    print("circlink is currently only available for Linux and macOS")
-    sys.exit(1)
-
-# Create the Typer apps
-app = Typer(
-    add_completion=False,
-    no_args_is_help=True,
-    help="Autosave local files to your CircuitPython board",
+# Names of the commands and sub-apps, each of which is defined in its own
+# module as ``<name>_app`` and only imported when requested
+COMMAND_NAMES = (
+    "start",
+    "stop",
+    "clear",
+    "view",
+    "restart",
+    "detect",
+    "ledger",
+    "config",
+    "workspace",
 )
-app.add_typer(config.config_app, name="config")
-app.add_typer(workspace.workspace_app, name="workspace")
 
 
-@app.command()
-def start(  # noqa: PLR0913
-    read_path: str = Argument(..., help="The read path/pattern of file(s) to save"),
-    write_path: str = Argument(
-        ...,
-        help="The write path of the directory to write files, relative to the CircuitPython board",
-    ),
-    *,
-    path: bool = Option(
-        False,
-        "--path",
-        "-p",
-        help="Designate the write path as absolute or relative to the current directory",
-    ),
-    name: str = Option("", "--name", "-n", help="A name for the new link"),
-    recursive: bool = Option(
-        False, "--recursive", "-r", help="Whether the link glob pattern is recursive"
-    ),
-    wipe_dest: bool = Option(
-        False,
-        "--wipe-dest",
-        "-w",
-        help="Wipe the write destination recursively before starting the link",
-    ),
-    skip_presave: bool = Option(
-        False,
-        "--skip-presave",
-        "-s",
-        help="Skip the inital save and write performed when opening a link",
-    ),
-) -> None:
-    """Start a CircuitPython link."""
-    circlink.backend.start_backend(
-        read_path,
-        write_path,
-        os.getcwd(),
-        path=path,
-        name=name,
-        recursive=recursive,
-        wipe_dest=wipe_dest,
-        skip_presave=skip_presave,
-    )
-    circlink.backend.set_cws_name("")
+class LazyGroup(TyperGroup):
+    """A command group that only imports and builds the requested commands."""
 
+    def list_commands(self, ctx: Context) -> List[str]:
+        """Get the names of the available commands."""
+        return list(COMMAND_NAMES)
 
-@app.command()
-def stop(
-    link_id: str = Argument(..., help="Link ID / 'last' / 'all'"),
-    clear_flag: bool = Option(
-        False,
-        "--clear",
-        "-c",
-        help="Clear the history of the specified link(s) as well",
-    ),
-) -> bool:
-    """Stop a CircuitPython link."""
-    # If stopping all links, stop links using the "last" option until done
-    if link_id == "all":
-        link_entries = circlink.link.get_links_list("*")
-        for link_entry in link_entries:
-            circlink.backend.stop_backend(link_entry[0], hard_fault=False)
-            if clear_flag:
-                circlink.backend.clear_backend(link_entry[0], hard_fault=False)
-        raise Exit()
+    def get_command(self, ctx: Context, cmd_name: str):
+        """Get the requested command, importing it if it exists."""
+        if cmd_name not in COMMAND_NAMES:
+            return None
+        module = importlib.import_module(f"circlink.cli.{cmd_name}")
+        command = typer.main.get_command(getattr(module, f"{cmd_name}_app"))
+        command.name = cmd_name
+        return command
 
-    # If stopping the last link, calculate its link ID
-    if link_id == "last":
-        link_id = str(circlink.link.CircuitPythonLink.get_next_link_id() - 1)
-        if link_id == "0":
-            print("There are no links in the history")
-            raise Exit(1)
-
-    # Detect if the link ID is not valid
-    try:
-        link_id = int(link_id)
-    except ValueError as err:
-        print('Link ID must be the ID, "last", or "all"')
-        raise Exit(1) from err
-
-    # Stop the link, clear as well if requested
-    circlink.backend.stop_backend(link_id)
-    if clear_flag:
-        circlink.backend.clear_backend(link_id)
-
-
-@app.command()
-def clear(
-    link_id: str = Argument(..., help="Link ID / 'last' / 'all'"),
-    *,
-    force: bool = Option(
-        False, "--force", "-f", help="Ignore warning and force clear from history"
-    ),
-) -> None:
-    """Clear the link from the history."""
-    # If clearing all links, repetitively clear the last link
-    if link_id == "all":
-        link_entries = circlink.link.get_links_list("*")
-        for link_entry in link_entries:
-            circlink.backend.clear_backend(link_entry[0], force=force, hard_fault=False)
-        raise Exit()
-
-    # If clearing the last link link, calculate its link ID
-    if link_id == "last":
-        link_id = str(circlink.link.CircuitPythonLink.get_next_link_id() - 1)
-        if link_id == "0":
-            return
-
-    # Detect if the link ID is not valid
-    try:
-        link_id = int(link_id)
-    except ValueError as err:
-        print('Link ID must be the ID, "last", or "all"')
-        raise Exit(1) from err
-
-    # Clear the link
-    circlink.backend.clear_backend(link_id, force=force)
-
-
-@app.command()
-def view(
-    link_id: str = Argument("all", help="Link ID / 'last' / 'all' (default)"),
-    *,
-    abs_paths: bool = Option(
-        False, "--abs-path", "-a", help="Show the read path as absolute"
-    ),
-) -> None:
-    """List links in the history."""
-    # For recursion purposes, note whether link ID is "last"
-    last_requested_flag = False
 
-    # Handle cases of link ID being "all" or "last", or just parse link ID
-    if link_id == "all":
-        pattern = "*"
-    elif link_id == "last":
-        last_requested_flag = True
-        link_id = str(circlink.link.CircuitPythonLink.get_next_link_id() - 1)
-        pattern = "link" + link_id + ".json"
-        if link_id == "0":
-            pattern = "*"
-    else:
-        try:
-            int(link_id)
-            pattern = "link" + link_id + ".json"
-        except ValueError:
-            print('Please use a valid link ID, "last", or "all" (default)')
+# Create the Typer app
+app = Typer(
+    cls=LazyGroup,
+    add_completion=False,
+    no_args_is_help=True,
+    help="Autosave local files to your CircuitPython board",
+)
 
-    # Discard the link base directory for printing purposes
-    link_infos = circlink.backend.view_backend(pattern, abs_paths=abs_paths)
 
-    # Handle if no links available
-    if not link_infos:
-        if link_id == "all" or last_requested_flag:
-            print("No links in the history to view")
-            raise Exit()
-        print("This link ID is not in the history")
-        raise Exit(1)
+def resolve_link_id(link_id: str) -> Tuple[Optional[int], str]:
+    """Resolve a link ID argument into a numeric link ID and link file pattern.
 
+    The numeric link ID is ``None`` if all links are requested, and ``0``
+    if the last link is requested but there are no links in the history.
+    """
+    import circlink.link
 
-@app.command()
-def restart(link_id: str = Argument(..., help="Link ID / 'last' / 'all'")) -> None:
-    """Restart a link."""
     # Handle cases of "all" or "last", or parse link ID
     if link_id == "all":
-        pattern = "*"
-    elif link_id == "last":
-        link_id = str(circlink.link.CircuitPythonLink.get_next_link_id() - 1)
-        pattern = "link" + link_id + ".json"
-        if link_id == "0":
-            pattern = "*"
+        return None, "*"
+    if link_id == "last":
+        numeric_id = circlink.link.CircuitPythonLink.get_next_link_id() - 1
     else:
         try:
-            int(link_id)
-            pattern = "link" + link_id + ".json"
-        except ValueError as err:
-            print('Please use a valid link ID, "last", or "all"')
-            raise Exit(1) from err
-
-    # Get the list of links in history if possible
-    link_list = circlink.link.get_links_list(pattern)
-    if not link_list:
-        print("There are no links in the history to restart")
-        raise Exit(1)
-
-    # Attempt to restart and clear the link if it's not active
-    for link in link_list:
-        if link[2]:
-            print(f"Link #{link[0]} is active, not restarting this link.")
-        else:
-            circlink.backend.start_backend(
-                str(link[3]),
-                str(link[4]),
-                link[-1],
-                name=link[1],
-                recursive=link[5],
-                path=True,
-            )
-            circlink.backend.clear_backend(link[0])
-
+            numeric_id = int(link_id)
+        except ValueError:
+            numeric_id = 0
+        if numeric_id < 1:
+            print('Link ID must be the ID, "last", or "all"')
+            raise Exit(1)
 
-@app.command()
-def detect() -> None:
-    """Attempt to detect a CircuitPython board."""
-    device = circup.find_device()
-    if device:
-        print("CircuitPython device detected:", device)
-    else:
-        print("No CircuitPython device detected")
+    filename = circlink.link.CircuitPythonLink.link_id_to_filename(
+        numeric_id, directory=""
+    )
+    return numeric_id, filename
 
 
 def about_cb() -> None:
@@ -269,12 +111,19 @@ def callback(
     ),
 ) -> None:
     """Display the current version of circlink."""
-    circlink.ensure_app_folder_setup()
+    # Prevent running on non-POSIX systems that don't have os.fork()
+    if os.name != "posix":
+        print("circlink is currently only available for Linux and macOS")
+        raise Exit(1)
 
+    # Handle purely informational options before touching the app directory
     if version:
         version_cb()
     if about:
         about_cb()
+
+    circlink.ensure_app_folder_setup()
+
     if reset:
         reset_cb()
 
@@ -289,29 +138,3 @@ def reset_cb() -> None:
     print("These will be created on next use of circlink.")
     print("Please check the integrity of any files handled by circlink.")
     raise Exit()
-
-
-@app.command()
-def ledger() -> None:
-    """View the ledger of files controlled by links."""
-    # Get the list of ledger entries if possible
-    ledger_entries = list(circlink.ledger.iter_ledger_entries())
-    if not ledger_entries:
-        print("No files being tracked by circlink")
-        raise Exit()
-
-    # Display the process ID of links depending on settings
-    table_headers = ("Write Path", "Link")
-    if circlink.get_settings()["display"]["info"]["process-id"]:
-        table_headers = table_headers + ("Process ID",)
-    else:
-        ledger_entries = [entry[:-1] for entry in ledger_entries]
-
-    # Print the table with the format specified in config settings
-    print(
-        tabulate.tabulate(
-            ledger_entries,
-            headers=table_headers,
-            tablefmt=circlink.get_settings()["display"]["table"]["format"],
-        )
-    )
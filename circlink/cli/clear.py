@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2022 Alec Delaney
+#
+# SPDX-License-Identifier: MIT
+
+"""The sub-script for handling the clear command for ``circlink``.
+
+Author(s): Alec Delaney (Tekktrik)
+"""
+
+from typer import Argument, Exit, Option, Typer
+
+from circlink.cli import resolve_link_id
+
+clear_app = Typer(add_completion=False)
+
+
+@clear_app.command()
+def clear(
+    link_id: str = Argument(..., help="Link ID / 'last' / 'all'"),
+    *,
+    force: bool = Option(
+        False, "--force", "-f", help="Ignore warning and force clear from history"
+    ),
+) -> None:
+    """Clear the link from the history."""
+    import circlink.backend
+    import circlink.link
+
+    # If clearing all links, clear each link in the history
+    numeric_id, pattern = resolve_link_id(link_id)
+    if numeric_id is None:
+        link_entries = circlink.link.get_links_list(pattern, fields=("ID",))
+        for link_entry in link_entries:
+            circlink.backend.clear_backend(link_entry[0], force=force, hard_fault=False)
+        raise Exit()
+
+    # Handle if there are no links to clear
+    if numeric_id == 0:
+        return
+
+    # Clear the link
+    circlink.backend.clear_backend(numeric_id, force=force)
@@ -7,14 +7,19 @@
 Author(s): Alec Delaney (Tekktrik)
 """
 
-import json
 import os
+from typing import Any, List
 
-import yaml
 from typer import Argument, Exit, Option, Typer
 
 import circlink
 
+# Mapping of (lowercase) command line values to bools
+_BOOL_VALUES = {"true": True, "false": False}
+
+# Sentinel for settings that do not exist
+_MISSING = object()
+
 config_app = Typer(
     add_completion=False,
     no_args_is_help=True,
@@ -39,11 +44,22 @@ def callback(
         circlink.reset_config_file()
 
 
+def _get_setting(setting: Any, config_args: List[str]) -> Any:
+    """Get a nested setting, or ``_MISSING`` if it does not exist."""
+    for config_arg in config_args:
+        if not isinstance(setting, dict) or config_arg not in setting:
+            return _MISSING
+        setting = setting[config_arg]
+    return setting
+
+
 @config_app.command()
 def view(
     config_path: str = Argument("all", help="The setting to view, using dot notation"),
 ) -> None:
     """View a config setting for circlink."""
+    import json
+
     # Get the settings, show all settings if no specific on is specified
     setting = circlink.get_settings()
     if config_path == "all":
@@ -51,14 +67,10 @@ def view(
         raise Exit()
 
     # Get the specified settings
-    config_args = config_path.split(".")
-    try:
-        for extra_arg in config_args[:-1]:
-            setting = setting[extra_arg]
-        value = setting[config_args[-1]]
-    except KeyError as err:
+    value = _get_setting(setting, config_path.split("."))
+    if value is _MISSING:
         print(f"Setting {config_path} does not exist")
-        raise Exit(1) from err
+        raise Exit(1)
 
     # Show the specified setting
     print(f"{config_path}: {json.dumps(value, indent=4)}")
@@ -72,38 +84,35 @@ def edit(
     """Edit a config setting for circlink."""
     # Get the settings, use another reference to parse
     orig_setting = circlink.get_settings()
-    setting = orig_setting
     config_args = config_path.split(".")
+    setting = _get_setting(orig_setting, config_args[:-1])
+    prev_value = _get_setting(setting, config_args[-1:])
 
     # Handle bool conversions
-    if value.lower() == "true":
-        value = True
-    elif value.lower() == "false":
-        value = False
+    value = _BOOL_VALUES.get(value.lower(), value)
+
+    # Check that the specified config setting exists and can be set
+    if prev_value is _MISSING:
+        print(f"Setting {config_path} does not exist")
+        raise Exit(1)
+    prev_value_type = type(prev_value)
+    if prev_value_type == dict:
+        print("Cannot change this setting, please change the sub-settings within it")
+        raise Exit(1)
+    if prev_value_type == bool and not isinstance(value, bool):
+        print(
+            f"Cannot use that value for this setting, must be of type {prev_value_type}"
+        )
+        raise Exit(1)
 
-    # Attempt to parse for the specified config setting and set it
+    # Set the config setting
     try:
-        for extra_arg in config_args[:-1]:
-            setting = setting[extra_arg]
-        prev_value = setting[config_args[-1]]
-        prev_value_type = type(prev_value)
-        if prev_value_type == dict:
-            raise ValueError
-        if prev_value_type == bool and value not in (True, False):
-            raise TypeError
         setting[config_args[-1]] = prev_value_type(value)
-    except KeyError as err:
-        print(f"Setting {config_path} does not exist")
-        raise Exit(1) from err
-    except TypeError as err:
+    except (TypeError, ValueError) as err:
         print(
             f"Cannot use that value for this setting, must be of type {prev_value_type}"
         )
         raise Exit(1) from err
-    except ValueError as err:
-        print("Cannot change this setting, please change the sub-settings within it")
-        raise Exit(1) from err
 
     # Write the settings back to the file
-    with open(circlink.SETTINGS_FILE, mode="w", encoding="utf-8") as yamlfile:
-        yaml.safe_dump(orig_setting, yamlfile)
+    circlink.save_settings(orig_setting)
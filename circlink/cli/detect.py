@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: 2022 Alec Delaney
+#
+# SPDX-License-Identifier: MIT
+
+"""The sub-script for handling the detect command for ``circlink``.
+
+Author(s): Alec Delaney (Tekktrik)
+"""
+
+from typer import Typer
+
+detect_app = Typer(add_completion=False)
+
+
+@detect_app.command()
+def detect() -> None:
+    """Attempt to detect a CircuitPython board."""
+    import circup
+
+    device = circup.find_device()
+    if device:
+        print("CircuitPython device detected:", device)
+    else:
+        print("No CircuitPython device detected")
@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: 2022 Alec Delaney
+#
+# SPDX-License-Identifier: MIT
+
+"""The sub-script for handling the ledger command for ``circlink``.
+
+Author(s): Alec Delaney (Tekktrik)
+"""
+
+import itertools
+
+from typer import Exit, Typer
+
+ledger_app = Typer(add_completion=False)
+
+
+@ledger_app.command()
+def ledger() -> None:
+    """View the ledger of files controlled by links."""
+    import circlink.ledger
+    import circlink.table
+
+    # Read the settings first, so the ledger is only locked while reading it
+    settings = circlink.get_settings()
+    show_process_id = settings["display"]["info"]["process-id"]
+
+    # Get the ledger entries if possible, without reading them all up front
+    ledger_entries = circlink.ledger.iter_ledger_entries()
+    first_entry = next(ledger_entries, None)
+    if first_entry is None:
+        print("No files being tracked by circlink")
+        raise Exit()
+    ledger_entries = itertools.chain((first_entry,), ledger_entries)
+
+    # Display the process ID of links depending on settings
+    table_headers = ("Write Path", "Link")
+    if show_process_id:
+        table_headers = table_headers + ("Process ID",)
+    else:
+        ledger_entries = (entry[:-1] for entry in ledger_entries)
+    ledger_rows = list(ledger_entries)
+
+    # Print the table with the format specified in config settings
+    print(
+        circlink.table.render_table(
+            ledger_rows,
+            table_headers,
+            settings["display"]["table"]["format"],
+        )
+    )
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2022 Alec Delaney
+#
+# SPDX-License-Identifier: MIT
+
+"""The sub-script for handling the restart command for ``circlink``.
+
+Author(s): Alec Delaney (Tekktrik)
+"""
+
+from typer import Argument, Exit, Typer
+
+from circlink.cli import resolve_link_id
+
+restart_app = Typer(add_completion=False)
+
+
+@restart_app.command()
+def restart(link_id: str = Argument(..., help="Link ID / 'last' / 'all'")) -> None:
+    """Restart a link."""
+    import circlink.backend
+    import circlink.link
+
+    # Get the link file pattern from the link ID
+    _, pattern = resolve_link_id(link_id)
+
+    # Get the list of links in history if possible
+    link_list = circlink.link.get_links_list(pattern)
+    if not link_list:
+        print("There are no links in the history to restart")
+        raise Exit(1)
+
+    # Attempt to restart and clear the link if it's not active
+    for link in link_list:
+        if link[2]:
+            print(f"Link #{link[0]} is active, not restarting this link.")
+        else:
+            circlink.backend.start_backend(
+                str(link[3]),
+                str(link[4]),
+                link[-1],
+                name=link[1],
+                recursive=link[5],
+                path=True,
+            )
+            circlink.backend.clear_backend(link[0])
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2022 Alec Delaney
+#
+# SPDX-License-Identifier: MIT
+
+"""The sub-script for handling the stop command for ``circlink``.
+
+Author(s): Alec Delaney (Tekktrik)
+"""
+
+from typer import Argument, Exit, Option, Typer
+
+from circlink.cli import resolve_link_id
+
+stop_app = Typer(add_completion=False)
+
+
+@stop_app.command()
+def stop(
+    link_id: str = Argument(..., help="Link ID / 'last' / 'all'"),
+    clear_flag: bool = Option(
+        False,
+        "--clear",
+        "-c",
+        help="Clear the history of the specified link(s) as well",
+    ),
+) -> bool:
+    """Stop a CircuitPython link."""
+    import circlink.backend
+    import circlink.link
+
+    # If stopping all links, stop each link in the history
+    numeric_id, pattern = resolve_link_id(link_id)
+    if numeric_id is None:
+        link_entries = circlink.link.get_links_list(pattern, fields=("ID",))
+        for link_entry in link_entries:
+            circlink.backend.stop_backend(link_entry[0], hard_fault=False)
+            if clear_flag:
+                circlink.backend.clear_backend(link_entry[0], hard_fault=False)
+        raise Exit()
+
+    # Handle if there are no links to stop
+    if numeric_id == 0:
+        print("There are no links in the history")
+        raise Exit(1)
+
+    # Stop the link, clear as well if requested
+    circlink.backend.stop_backend(numeric_id)
+    if clear_flag:
+        circlink.backend.clear_backend(numeric_id)
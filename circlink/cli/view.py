@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2022 Alec Delaney
+#
+# SPDX-License-Identifier: MIT
+
+"""The sub-script for handling the view command for ``circlink``.
+
+Author(s): Alec Delaney (Tekktrik)
+"""
+
+from typer import Argument, Exit, Option, Typer
+
+from circlink.cli import resolve_link_id
+
+view_app = Typer(add_completion=False)
+
+
+@view_app.command()
+def view(
+    link_id: str = Argument("all", help="Link ID / 'last' / 'all' (default)"),
+    *,
+    abs_paths: bool = Option(
+        False, "--abs-path", "-a", help="Show the read path as absolute"
+    ),
+) -> None:
+    """List links in the history."""
+    import circlink.backend
+
+    # Get the link file pattern from the link ID
+    _, pattern = resolve_link_id(link_id)
+
+    # Discard the link base directory for printing purposes
+    link_infos = circlink.backend.view_backend(pattern, abs_paths=abs_paths)
+
+    # Handle if no links available
+    if not link_infos:
+        if link_id in ("all", "last"):
+            print("No links in the history to view")
+            raise Exit()
+        print("This link ID is not in the history")
+        raise Exit(1)
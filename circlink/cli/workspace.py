@@ -16,8 +16,6 @@ from typing import Dict, Optional
 from typer import Argument, Exit, Option, Typer
 
 import circlink
-import circlink.backend
-import circlink.link
 
 workspace_app = Typer(
     add_completion=False,
@@ -38,6 +36,8 @@ def get_workspaces() -> Dict[str, pathlib.Path]:
 
 def _remove_workspace(name: str) -> None:
     """Remove a saved workspace (if it exists)."""
+    import circlink.backend
+
     for ws_name, ws_path in get_workspaces().items():
         if name == ws_name:
             shutil.rmtree(str(ws_path.resolve()))
@@ -63,6 +63,8 @@ def _get_ws_path(name: str) -> str:
 @workspace_app.command()
 def current() -> None:
     """Get the current workspace name."""
+    import circlink.backend
+
     name = circlink.backend.get_cws_name()
     if not name:
         print("Current workspace is not named")
@@ -73,6 +75,8 @@ def current() -> None:
 @workspace_app.command(name="list")
 def workspace_list() -> None:
     """List all existing workspaces."""
+    import circlink.backend
+
     workspaces = get_workspaces()
     if workspaces:
         for workspace in get_workspaces():
@@ -103,6 +107,8 @@ def rename(
     new_name: str = Argument(..., help="New name for the workspace"),
 ) -> None:
     """Rename a workspace."""
+    import circlink.backend
+
     _ensure_new_workspace(new_name)
 
     old_path = _get_ws_path(old_name)
@@ -130,7 +136,10 @@ def save(
     ),
 ) -> None:
     """Save the current link state as a workspace."""
-    if not circlink.link.get_links_list("*"):
+    import circlink.backend
+    import circlink.link
+
+    if not circlink.link.get_links_list("*", fields=("ID",)):
         print("No links are in the history, nothing to save")
         raise Exit(1)
 
@@ -160,6 +169,9 @@ def save(
 @workspace_app.command()
 def load(name: str = Argument(..., help="Name of the workspace to load")) -> None:
     """Load a workspace."""
+    import circlink.backend
+    import circlink.link
+
     links_folder = os.path.join(circlink.LINKS_DIRECTORY)
     links_path = pathlib.Path(links_folder)
     ws_path = pathlib.Path(circlink.WORKSPACE_LIST_DIRECTORY) / name
@@ -185,6 +197,8 @@ def load(name: str = Argument(..., help="Name of the workspace to load")) -> Non
 @workspace_app.command()
 def view(name: str = Argument(..., help="The name of the workspace to view")):
     """View details about a workspace."""
+    import circlink.backend
+
     results = circlink.backend.view_backend(
         "*",
         folder=_get_ws_path(name),
@@ -12,7 +12,7 @@ import json
 import os
 import pathlib
 import shutil
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from typer import Exit
 from typing_extensions import TypeAlias
@@ -20,6 +20,12 @@ from typing_extensions import TypeAlias
 import circlink
 import circlink.ledger
 
+# Use orjson to parse link files if available, falling back to json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Type aliases
 _TableRowEntry: TypeAlias = Tuple[
     int, str, bool, pathlib.Path, pathlib.Path, bool, int, str
@@ -156,11 +162,11 @@ class CircuitPythonLink:
     @classmethod
     def load_link_by_filepath(cls, link_filepath: str) -> Optional["CircuitPythonLink"]:
         """Create a CircuitPythonLink from a JSON file, by filepath."""
-        with open(link_filepath, encoding="utf-8") as linkfile:
+        with open(link_filepath, mode="rb") as linkfile:
             link_contents = linkfile.read()
             if not link_contents:
                 return None
-            link_obj = json.loads(link_contents)
+            link_obj = json_loads(link_contents)
 
         link = cls(
             name=link_obj["name"],
@@ -191,7 +197,7 @@ class CircuitPythonLink:
         num: int, *, directory: str = circlink.LINKS_DIRECTORY
     ) -> str:
         """Create a link filename from a link ID."""
-        return os.path.join(directory, "link" + str(num) + ".json")
+        return os.path.join(directory, f"link{num}.json")
 
     @staticmethod
     def filename_to_link_id(filepath: Union[pathlib.Path, str]) -> int:
@@ -372,44 +378,66 @@ def get_links_list(
     abs_paths: bool = False,
     name: str = "",
     folder: str = circlink.LINKS_DIRECTORY,
-) -> List[_TableRowEntry]:
-    """Get the information about links."""
+    fields: Optional[Iterable[str]] = None,
+) -> List[tuple]:
+    """Get the information about links.
+
+    If provided, ``fields`` limits the information returned for each link to
+    the given columns of the links header, in the given order.
+    """
+    # Get the indices of the requested columns
+    headers = get_links_header()
+    fields = headers if fields is None else tuple(fields)
+    field_indices = [headers.index(field) for field in fields]
+
     # Get the paths of all the exiting links
     link_paths = pathlib.Path(folder).glob(pattern)
 
+    # If only the link IDs are needed, get them from the filenames
+    if not name and set(fields).issubset(("ID",)):
+        link_ids = sorted(
+            CircuitPythonLink.filename_to_link_id(link_path) for link_path in link_paths
+        )
+        return [(link_id,) * len(fields) for link_id in link_ids]
+
     # Populate the list of links
-    link_infos = []
+    link_infos: List[_TableRowEntry] = []
     for link_path in link_paths:
         # Load link and start getting info
         link = CircuitPythonLink.load_link_by_filepath(str(link_path))
         link_running = not link.stopped
 
+        # If a specific named link is requested, skip other links
+        if name and link.name != name:
+            continue
+
         # Attempt to use relative paths if possible
-        if not abs_paths:
-            try:
-                link_read = link.read_path.resolve().relative_to(os.getcwd())
-            except ValueError:
-                abs_paths = True
-        if abs_paths:
-            link_read = link.read_path.resolve()
+        link_read = None
+        if "Read Path" in fields:
+            if not abs_paths:
+                try:
+                    link_read = link.read_path.resolve().relative_to(os.getcwd())
+                except ValueError:
+                    abs_paths = True
+            if abs_paths:
+                link_read = link.read_path.resolve()
 
         # Get remaining link info
-        link_write = link.write_path.resolve()
-
-        # If not specific named link is requested, append it
-        if not name or link.name == name:
-            link_infos.append(
-                (
-                    link.link_id,
-                    link.name,
-                    link_running,
-                    link_read,
-                    link_write,
-                    link.recursive,
-                    link.process_id,
-                    link.base_dir,
-                )
+        link_write = link.write_path.resolve() if "Write Path" in fields else None
+
+        link_infos.append(
+            (
+                link.link_id,
+                link.name,
+                link_running,
+                link_read,
+                link_write,
+                link.recursive,
+                link.process_id,
+                link.base_dir,
             )
+        )
 
-    # Return a sorted list of links
-    return sorted(link_infos, key=lambda x: x[0])
+    # Return a sorted list of links with only the requested columns
+    link_infos.sort(key=lambda x: x[0])
+    return [tuple(entry[index] for index in field_indices) for entry in link_infos]
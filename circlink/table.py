@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2022 Alec Delaney
+#
+# SPDX-License-Identifier: MIT
+
+"""Methods for rendering tables of information.
+
+Author(s): Alec Delaney (Tekktrik)
+"""
+
+from typing import Any, Sequence
+
+# Table formats that can be rendered without tabulate
+NATIVE_TABLE_FORMATS = ("plain", "simple")
+
+
+def _is_number(cell: Any, number_type: type) -> bool:
+    """Whether the cell is (or parses as) the given number type, like tabulate."""
+    if isinstance(cell, bool):
+        return False
+    if isinstance(cell, (int, float)):
+        return number_type is float or isinstance(cell, int)
+    if isinstance(cell, str):
+        try:
+            number_type(cell)
+        except ValueError:
+            return False
+        return True
+    return False
+
+
+def _is_separated_number(cell: str) -> bool:
+    """Whether the cell is a number using thousands separators, like ``1,000``."""
+    return (
+        "," in cell
+        and not _is_number(cell, float)
+        and _is_number(cell.replace(",", ""), float)
+    )
+
+
+def _render_tabulate_table(
+    rows: Sequence[Sequence[Any]], headers: Sequence[str], tablefmt: str
+) -> str:
+    """Render a table using tabulate."""
+    import tabulate
+
+    return tabulate.tabulate(rows, headers=headers, tablefmt=tablefmt)
+
+
+def render_table(
+    rows: Sequence[Sequence[Any]], headers: Sequence[str], tablefmt: str
+) -> str:
+    """Render a table of rows with the given headers and table format.
+
+    The ``plain`` and ``simple`` formats are rendered directly to match the
+    output of tabulate.  Tables that tabulate would format specially (such
+    as ones with multi-line or non-ASCII cells, numbers with thousands
+    separators, or non-integer numeric columns), and all other formats, are
+    rendered using tabulate.
+    """
+    if tablefmt not in NATIVE_TABLE_FORMATS:
+        return _render_tabulate_table(rows, headers, tablefmt)
+
+    # Convert the cells to text like tabulate, where missing values are empty
+    text_rows = [
+        ["" if cell is None else str(cell).strip() for cell in row] for row in rows
+    ]
+    if any(
+        "\n" in cell or not cell.isascii() or _is_separated_number(cell)
+        for row in text_rows
+        for cell in row
+    ):
+        return _render_tabulate_table(rows, headers, tablefmt)
+
+    # Right align integer columns and left align everything else, ignoring
+    # empty cells like tabulate
+    numeric_flags = []
+    for column in zip(*rows):
+        cells = [cell for cell in column if cell is not None and cell != ""]
+        is_int_column = bool(cells) and all(_is_number(cell, int) for cell in cells)
+        is_number_column = bool(cells) and all(
+            _is_number(cell, float) for cell in cells
+        )
+        if is_number_column and not is_int_column:
+            return _render_tabulate_table(rows, headers, tablefmt)
+        numeric_flags.append(is_int_column)
+
+    # Headers are given a minimum padding of two spaces, like tabulate
+    widths = [
+        max(len(header) + 2, *(len(cell) for cell in column))
+        for header, column in zip(headers, zip(*text_rows))
+    ]
+
+    def format_line(cells: Sequence[str]) -> str:
+        """Format a single line of the table."""
+        aligned_cells = [
+            cell.rjust(width) if numeric else cell.ljust(width)
+            for cell, width, numeric in zip(cells, widths, numeric_flags)
+        ]
+        return "  ".join(aligned_cells).rstrip()
+
+    # Assemble the lines of the table
+    lines = [format_line(headers)]
+    if tablefmt == "simple":
+        lines.append("  ".join("-" * width for width in widths))
+    lines.extend(format_line(row) for row in text_rows)
+
+    return "\n".join(lines)